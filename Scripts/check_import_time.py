@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Import Time Check
+=================
+Development check that keeps ``import visual_foundations`` fast.
+
+visual_foundations.py loads matplotlib, seaborn, plotly, pandas and scipy
+only when a plot is actually made. This script imports the module in a fresh
+interpreter with ``-X importtime`` and fails if any of those libraries were
+pulled in by the bare import, or if the total import time exceeds a budget.
+Run it after adding imports to the library so a slow top-level import is
+caught before it reaches users.
+
+Part of the Astronomy Starter Kit
+https://github.com/RedChaosWolf92/astronomy-starter-kit
+
+Author: Greg (RedChaosWolf92)
+License: MIT
+
+Usage:
+------
+    python check_import_time.py
+    python check_import_time.py --max-ms 250 --top 15
+
+Exit Codes:
+-----------
+    0 - Import is within budget and no plotting library was loaded
+    1 - A plotting library was loaded, the budget was exceeded, or the
+        import time could not be measured
+"""
+
+import os
+import subprocess
+import sys
+
+# Module under test and the libraries a bare import must not load
+TARGET_MODULE = 'visual_foundations'
+DEFERRED_PACKAGES = ('matplotlib', 'seaborn', 'plotly', 'pandas', 'scipy')
+
+# Default budget for the cumulative import time, in milliseconds
+DEFAULT_MAX_MS = 150.0
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def measure_import(module=TARGET_MODULE):
+    """
+    Import a module in a fresh interpreter and collect -X importtime data.
+    
+    Parameters:
+    -----------
+    module : str
+        Name of the module to import (looked up next to this script)
+    
+    Returns:
+    --------
+    list of tuple
+        (self_us, cumulative_us, name) for every module imported, in the
+        order reported by the interpreter
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=script_dir)
+    
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=script_dir, env=env
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+    
+    entries = []
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented name>"
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Column header line
+        entries.append((int(fields[0]), int(fields[1]), fields[2].strip()))
+    return entries
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def check_import_time(max_ms=DEFAULT_MAX_MS, top=10):
+    """
+    Check the import of visual_foundations against the budget.
+    
+    Parameters:
+    -----------
+    max_ms : float
+        Maximum allowed cumulative import time in milliseconds
+    
+    top : int
+        Number of slowest modules (by self time) to list
+    
+    Returns:
+    --------
+    bool
+        True if the check passed
+    """
+    entries = measure_import()
+    
+    total_us = next((cumulative for _, cumulative, name in entries
+                     if name == TARGET_MODULE), None)
+    if total_us is None:
+        # Without the module's own entry there is nothing to hold to the
+        # budget; treating it as 0 ms would pass silently
+        print(f"✗ No -X importtime entry for {TARGET_MODULE}; "
+              "cannot measure the import")
+        return False
+    loaded = {name.split('.', 1)[0] for _, _, name in entries}
+    eager = [pkg for pkg in DEFERRED_PACKAGES if pkg in loaded]
+    
+    print(f"import {TARGET_MODULE}: {total_us / 1000:.1f} ms "
+          f"(budget {max_ms:.0f} ms)")
+    
+    if top > 0:
+        print(f"\nSlowest {top} modules by self time:")
+        for self_us, _, name in sorted(entries, reverse=True)[:top]:
+            print(f"  {self_us / 1000:8.1f} ms  {name}")
+    
+    passed = True
+    if eager:
+        print(f"\n✗ Loaded at import time: {', '.join(eager)}")
+        print("  Move these imports into the _ensure_* helpers.")
+        passed = False
+    if total_us / 1000 > max_ms:
+        print(f"\n✗ Import time exceeds the {max_ms:.0f} ms budget")
+        passed = False
+    if passed:
+        print("\n✓ Import time check passed")
+    return passed
+
+
+def main():
+    """Main entry point with argument parsing."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description=f'Check that import {TARGET_MODULE} stays fast'
+    )
+    parser.add_argument(
+        '--max-ms',
+        type=float,
+        default=DEFAULT_MAX_MS,
+        help=f'Import time budget in milliseconds (default: {DEFAULT_MAX_MS:.0f})'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=10,
+        help='Number of slowest modules to list (default: 10)'
+    )
+    args = parser.parse_args()
+    
+    sys.exit(0 if check_import_time(args.max_ms, args.top) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,27 +24,37 @@ Then open your browser to: http://localhost:8050
 
 Dependencies:
 -------------
-    pip install dash plotly numpy pandas
+    pip install "dash>=2.15" plotly numpy pandas
+    pip install orjson   # optional, plotly then uses it to encode figure JSON
+    pip install "dash[compress]"   # optional, gzip-compressed responses
 """
 
-import numpy as np
+import base64
+import functools
+import importlib.util
+import sys
 import warnings
+import zlib
+from types import MappingProxyType
+
+import numpy as np
 
 # Check for required dependencies
 try:
     import dash
-    from dash import dcc, html, Input, Output
-    import plotly.graph_objects as go
+    from dash import dcc, html, Input, Output, Patch, ctx
     DASH_AVAILABLE = True
 except ImportError:
     DASH_AVAILABLE = False
     warnings.warn("dash not available. Install with: pip install dash")
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+# plotly.graph_objects is heavy to import and is only needed once figures
+# are actually built, so it is imported lazily. Tools that just want the
+# constants (DATA_TYPE_INFO, styles) stay lightweight.
+
+# Dash gzips its responses when flask-compress is installed (dash[compress]);
+# plotly figure JSON compresses several times over
+COMPRESS_AVAILABLE = importlib.util.find_spec('flask_compress') is not None
 
 # Try to import VisualFoundations for consistent styling
 try:
@@ -120,6 +130,52 @@ INFO_PANEL_STYLE = {
     'marginTop': '20px',
 }
 
+# Precomputed layout variants (built once here instead of merging dicts
+# inline wherever a card or control column is laid out)
+HALF_CARD_STYLE = {
+    **CARD_STYLE,
+    'width': '48%',
+    'display': 'inline-block',
+    'verticalAlign': 'top',
+}
+
+HALF_CARD_RIGHT_STYLE = {
+    **HALF_CARD_STYLE,
+    'marginLeft': '2%',
+}
+
+TIPS_CARD_STYLE = {
+    **CARD_STYLE,
+    'marginTop': '20px',
+}
+
+CARD_TITLE_STYLE = {
+    'color': DASHBOARD_STYLES['text'],
+    'marginBottom': '15px',
+    'fontSize': '20px',
+}
+
+CONTROL_COLUMN_STYLE = {
+    'width': '32%',
+    'display': 'inline-block',
+    'verticalAlign': 'top',
+    'padding': '10px',
+}
+
+HELP_TEXT_STYLE = {
+    'color': DASHBOARD_STYLES['text_muted'],
+    'fontSize': '14px',
+    'marginTop': '8px',
+}
+
+SLIDER_MARK_STYLE = {'color': '#FFFFFF', 'fontSize': '14px'}
+
+
+@functools.lru_cache(maxsize=32)
+def _border(width, color):
+    """Return an interned CSS border value such as '3px solid #2ECC71'."""
+    return sys.intern(f"{width}px solid {color}")
+
 
 # =============================================================================
 # DATA TYPE DESCRIPTIONS (Educational Content)
@@ -248,6 +304,405 @@ STATS_EXPLANATIONS = {
     ),
 }
 
+# Freeze the educational tables: they are read-only lookup data, so sharing
+# one immutable copy keeps callbacks from mutating them by accident and lets
+# forked server workers share the same pages.
+_INTERNED_FIELDS = ('icon', 'title', 'xlabel', 'ylabel')
+
+DATA_TYPE_INFO = MappingProxyType({
+    sys.intern(key): MappingProxyType({
+        field: sys.intern(text) if field in _INTERNED_FIELDS else text
+        for field, text in info.items()
+    })
+    for key, info in DATA_TYPE_INFO.items()
+})
+
+STATS_EXPLANATIONS = MappingProxyType({
+    sys.intern(key): text for key, text in STATS_EXPLANATIONS.items()
+})
+
+# Column views of DATA_TYPE_INFO, in dropdown order. Code that needs one
+# field for every data type (menus, labels) walks a flat tuple instead of
+# indexing into each nested record.
+DATA_TYPE_KEYS = tuple(DATA_TYPE_INFO)
+DATA_TYPE_ICONS = tuple(DATA_TYPE_INFO[k]['icon'] for k in DATA_TYPE_KEYS)
+DATA_TYPE_TITLES = tuple(DATA_TYPE_INFO[k]['title'] for k in DATA_TYPE_KEYS)
+
+DATA_TYPE_OPTIONS = [
+    {'label': f"{icon} {title}", 'value': key}
+    for key, icon, title in zip(DATA_TYPE_KEYS, DATA_TYPE_ICONS, DATA_TYPE_TITLES)
+]
+
+# Pre-built strings for the main plot, one per data type
+PLOT_TITLES = {
+    key: f"<b>{icon} {title}</b>"
+    for key, icon, title in zip(DATA_TYPE_KEYS, DATA_TYPE_ICONS, DATA_TYPE_TITLES)
+}
+
+HOVER_TEMPLATES = {
+    key: (
+        f"<b>{info['xlabel']}:</b> %{{x:.4f}}<br>"
+        f"<b>{info['ylabel']}:</b> %{{y:.4f}}<br>"
+        "<extra></extra>"
+    )
+    for key, info in DATA_TYPE_INFO.items()
+}
+
+
+# =============================================================================
+# DATA GENERATORS
+# =============================================================================
+# One vectorized NumPy generator per data type. They all share the signature
+# (x, noise_level, rng) -> y, so they can be dispatched from a table and reused
+# without building the Dash app.
+
+# Parameter bounds shared by the sliders and the callback. Every request is
+# clamped to them, so a hand-crafted request cannot ask for an arbitrarily
+# large array and tie up a server worker.
+N_POINTS_RANGE = (20, 300)
+NOISE_RANGE = (0.0, 0.5)
+
+# Initial control values; the first render is built from these in the layout
+DEFAULT_DATA_TYPE = 'sine'
+DEFAULT_N_POINTS = 100
+DEFAULT_NOISE_LEVEL = 0.1
+
+
+def _gen_sine(x, noise_level, rng):
+    """Periodic sine wave with uniform noise."""
+    return np.sin(x) + noise_level * rng.random(x.size)
+
+
+def _gen_exponential(x, noise_level, rng):
+    """Exponential decay curve with uniform noise."""
+    return np.exp(-x / 3) + noise_level * 0.5 * rng.random(x.size)
+
+
+_ABSORPTION_CENTERS = np.array([2.5, 5.0, 7.5])
+_ABSORPTION_DEPTHS = np.array([0.25, 0.15, 0.20])
+
+
+def _gen_spectrum(x, noise_level, rng):
+    """Continuum with Gaussian absorption features."""
+    # Continuum with noise
+    y = 1 + 0.1 * np.sin(5 * x) + noise_level * 0.5 * rng.random(x.size)
+    # Add absorption features: one Gaussian per line, stacked as rows and
+    # weighted by depth in a single matrix-vector product
+    profiles = np.exp(-(x - _ABSORPTION_CENTERS[:, None])**2 / 0.15)
+    y -= _ABSORPTION_DEPTHS @ profiles
+    return y
+
+
+def _gen_lightcurve(x, noise_level, rng):
+    """Slow dimming trend plus periodic variation."""
+    # Accumulate into the noise buffer, with one scratch array for the terms
+    y = rng.random(x.size)
+    y *= noise_level * 0.2
+    y += 1
+    scratch = np.multiply(x, -0.01)  # Slow dimming
+    y += scratch
+    np.multiply(x, 2 * np.pi / 2.5, out=scratch)  # Periodic variation
+    np.sin(scratch, out=scratch)
+    scratch *= 0.08
+    y += scratch
+    return y
+
+
+def _gen_transit(x, noise_level, rng):
+    """Flat-bottomed exoplanet transit with ingress and egress."""
+    transit_center = 5.0
+    transit_half = 1.5 / 2  # half the transit duration
+    transit_depth = 0.015
+    # Ingress and egress mirror each other about the center, so both the
+    # flat bottom and the smooth edges can be read off one distance array
+    dist = np.abs(x - transit_center)
+    in_transit = dist < transit_half
+    edges = (dist > transit_half - 0.1) & (dist < transit_half + 0.3)
+    y = 1.0 - transit_depth * (in_transit + 0.5 * edges)
+    y += noise_level * 0.1 * rng.random(x.size)
+    return y
+
+
+def _gen_random_walk(x, noise_level, rng):
+    """Cumulative sum of Gaussian steps."""
+    # Draw, scale and accumulate the steps in one buffer
+    y = np.empty(x.size)
+    rng.standard_normal(out=y)
+    y *= 0.3
+    np.cumsum(y, out=y)
+    y += noise_level * rng.random(x.size)
+    return y
+
+
+_GENERATORS = {
+    'sine': _gen_sine,
+    'exponential': _gen_exponential,
+    'spectrum': _gen_spectrum,
+    'lightcurve': _gen_lightcurve,
+    'transit': _gen_transit,
+    'random': _gen_random_walk,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _linspace(n_points):
+    """Read-only x grid shared by every data type with this point count."""
+    x = np.linspace(0, 10, n_points)
+    x.setflags(write=False)
+    return x
+
+
+@functools.lru_cache(maxsize=256)
+def generate_data(data_type, n_points, noise_level, seed=0):
+    """
+    Generate sample astronomical data based on user parameters.
+    
+    Results are memoized on the full parameter tuple, so revisiting a
+    slider position returns the cached arrays instead of regenerating
+    them. Noise is drawn from a generator seeded with ``seed`` together
+    with the parameter key, so every data type and slider position gets
+    its own independent noise, and a cache miss still reproduces exactly
+    the data a fresh run would. The returned arrays are
+    read-only because they are shared between callers, and stored as
+    float32: plots are drawn at screen resolution, so single precision
+    halves the payload and memory traffic with no visible difference.
+    
+    Parameters:
+    -----------
+    data_type : str
+        Type of data to generate
+    n_points : int
+        Number of data points
+    noise_level : float
+        Amount of random noise to add
+    seed : int
+        Base seed for the noise generator, combined with the other
+        parameters (default: 0)
+        
+    Returns:
+    --------
+    x, y : numpy float32 arrays
+        The generated data
+    """
+    # A fresh PCG64 generator per call, rather than one shared instance:
+    # it is lock-free like a shared one would be, and seeding it from the
+    # full key gives each parameter set independent noise. Seeding here is
+    # what makes a cache miss reproduce exactly the data a hit would return.
+    # crc32 rather than hash(): str hashes are randomized per process
+    rng = np.random.default_rng([
+        seed,
+        zlib.crc32(data_type.encode()),
+        n_points,
+        round(noise_level * 1000),
+    ])
+    x = _linspace(n_points)
+    generator = _GENERATORS.get(data_type, _gen_random_walk)
+    y = generator(x, noise_level, rng).astype(np.float32)
+    x = x.astype(np.float32)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+
+@functools.lru_cache(maxsize=256)
+def compute_statistics(data_type, n_points, noise_level, seed=0):
+    """
+    Summary statistics for the memoized data of a parameter set.
+    
+    Returns:
+    --------
+    mapping : read-only 'mean', 'std', 'median', 'min', 'max' and 'range'
+    """
+    _, y = generate_data(data_type, n_points, noise_level, seed)
+    n = y.size
+    
+    # One partial sort yields min, max and both middle values for the
+    # median, replacing separate min/max/median passes over the data
+    lo, hi = (n - 1) // 2, n // 2
+    part = np.partition(y, (0, lo, hi, n - 1))
+    min_val = float(part[0])
+    max_val = float(part[-1])
+    median_val = (float(part[lo]) + float(part[hi])) / 2
+    
+    # Reuse the mean for the deviations instead of letting np.std compute
+    # it again; accumulate in float64 so float32 storage costs no accuracy
+    mean_val = y.mean(dtype=np.float64)
+    dev = np.subtract(y, mean_val, dtype=np.float64)
+    std_val = np.sqrt(np.dot(dev, dev) / n)
+    
+    return MappingProxyType({
+        'mean': mean_val,
+        'std': std_val,
+        'median': median_val,
+        'min': min_val,
+        'max': max_val,
+        'range': max_val - min_val,
+    })
+
+
+HIST_BINS = 25
+
+
+@functools.lru_cache(maxsize=256)
+def compute_histogram(data_type, n_points, noise_level, seed=0):
+    """
+    Bin the memoized data of a parameter set for the distribution plot.
+    
+    Binning on the server sends HIST_BINS bars to the browser instead of
+    the full series for plotly.js to re-bin on every update.
+    
+    Returns:
+    --------
+    centers, counts : read-only numpy arrays
+        Bin centers and the number of points in each bin
+    """
+    _, y = generate_data(data_type, n_points, noise_level, seed)
+    counts, edges = np.histogram(y, bins=HIST_BINS)
+    counts = counts.astype(np.int32)
+    centers = (edges[:-1] + edges[1:]) / 2
+    centers = centers.astype(np.float32)
+    centers.setflags(write=False)
+    counts.setflags(write=False)
+    return centers, counts
+
+
+# =============================================================================
+# FIGURE TEMPLATES
+# =============================================================================
+
+# plotly.js type codes for the array dtypes the dashboard sends
+_TYPED_ARRAY_CODES = {
+    np.dtype(np.float32): 'f4',
+    np.dtype(np.float64): 'f8',
+    np.dtype(np.int32): 'i4',
+}
+
+
+def _typed_array(arr):
+    """
+    Encode an array as a plotly.js typed-array spec.
+    
+    plotly.js (2.28+) accepts {'dtype', 'bdata'} in place of a JSON list
+    and decodes it straight into a TypedArray, so float32 data travels as
+    4 raw bytes per value (base64) instead of a decimal string per value.
+    """
+    arr = np.ascontiguousarray(arr)
+    return {
+        'dtype': _TYPED_ARRAY_CODES[arr.dtype],
+        'bdata': base64.b64encode(arr).decode('ascii'),
+    }
+
+
+# Layout settings shared by every data type. Only the titles that name the
+# data type's axes are added per figure in _figure_templates.
+MAIN_LAYOUT_TEMPLATE = {
+    'template': 'plotly_dark',
+    'height': 500,
+    'font': {'size': 16, 'color': 'white'},
+    'plot_bgcolor': 'rgba(22, 33, 62, 0.8)',
+    'paper_bgcolor': 'rgba(0, 0, 0, 0)',
+    'hovermode': 'closest',
+    'margin': {'l': 60, 'r': 40, 't': 60, 'b': 50},
+    'xaxis': {'gridcolor': 'rgba(255,255,255,0.1)', 'tickfont': {'size': 14}},
+    'yaxis': {'gridcolor': 'rgba(255,255,255,0.1)', 'tickfont': {'size': 14}},
+}
+
+HIST_LAYOUT_TEMPLATE = {
+    'title': {
+        'text': '<b>Y-Value Distribution</b>',
+        'font': {'size': 18, 'color': 'white'},
+        'x': 0.5,
+    },
+    'template': 'plotly_dark',
+    'height': 350,
+    'font': {'size': 14, 'color': 'white'},
+    'plot_bgcolor': 'rgba(22, 33, 62, 0.8)',
+    'paper_bgcolor': 'rgba(0, 0, 0, 0)',
+    'margin': {'l': 50, 'r': 30, 't': 50, 'b': 40},
+    'bargap': 0.1,
+    'xaxis': {'gridcolor': 'rgba(255,255,255,0.1)'},
+    'yaxis': {
+        'gridcolor': 'rgba(255,255,255,0.1)',
+        'title': {'text': 'Frequency', 'font': {'size': 14}},
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _figure_templates(data_type, line_color, hist_color):
+    """
+    Build the main plot and histogram figures for a data type once.
+    
+    Everything except the data arrays depends only on the data type and
+    the color scheme, so the figures are validated by plotly a single time
+    and cached as plain JSON-ready dicts. Callbacks copy the trace dict and
+    drop in fresh x/y values instead of rebuilding go.Figure objects on
+    every slider change.
+    
+    Returns:
+    --------
+    main_fig, hist_fig : dict
+        Figure dicts whose traces have empty data arrays
+    """
+    import plotly.graph_objects as go
+    
+    info = DATA_TYPE_INFO[data_type]
+    
+    # ============================================================
+    # MAIN PLOT
+    # ============================================================
+    # Scattergl draws with WebGL, so redraw cost stays flat as the point
+    # count grows instead of adding one SVG path node per marker
+    main_fig = go.Figure()
+    
+    main_fig.add_trace(go.Scattergl(
+        x=[], y=[],
+        mode='lines+markers',
+        name='Data',
+        line=dict(color=line_color, width=3),
+        marker=dict(
+            size=7,
+            color='white',
+            line=dict(width=2, color=line_color)
+        ),
+        hovertemplate=HOVER_TEMPLATES[data_type],
+    ))
+    
+    main_fig.update_layout(
+        MAIN_LAYOUT_TEMPLATE,
+        title=dict(
+            text=PLOT_TITLES[data_type],
+            font=dict(size=24, color='white'),
+            x=0.5,
+        ),
+        xaxis_title=dict(text=info['xlabel'], font=dict(size=18)),
+        yaxis_title=dict(text=info['ylabel'], font=dict(size=18)),
+    )
+    
+    # ============================================================
+    # HISTOGRAM
+    # ============================================================
+    hist_fig = go.Figure()
+    
+    hist_fig.add_trace(go.Bar(
+        x=[], y=[],
+        name='Distribution',
+        marker_color=hist_color,
+        opacity=0.8,
+        hovertemplate=(
+            "<b>Value:</b> %{x:.3f}<br>"
+            "<b>Count:</b> %{y}<br>"
+            "<extra></extra>"
+        ),
+    ))
+    
+    hist_fig.update_layout(
+        HIST_LAYOUT_TEMPLATE,
+        xaxis_title=dict(text=info['ylabel'], font=dict(size=14)),
+    )
+    
+    return main_fig.to_plotly_json(), hist_fig.to_plotly_json()
+
 
 # =============================================================================
 # FOUNDATION DASHBOARD CLASS
@@ -289,20 +744,54 @@ class FoundationDashboard:
         self.app = dash.Dash(
             __name__,
             title="Astronomy Foundation Dashboard",
-            update_title="Updating...",
+            # Keep the tab title fixed instead of rewriting it on every
+            # slider update
+            update_title=None,
             suppress_callback_exceptions=True,
+            compress=COMPRESS_AVAILABLE,
         )
         
         # Store color scheme
         self.colors = ACCESSIBLE_COLORS
         
+        # Cache built statistics panels per (data_type, n_points, noise_level)
+        self._build_stats_panel = functools.lru_cache(maxsize=256)(
+            self._build_stats_panel
+        )
+        
+        # The education panel only depends on the data type
+        self._build_education_panel = functools.lru_cache(maxsize=8)(
+            self._build_education_panel
+        )
+        
         # Setup the dashboard
         self._setup_layout()
         self._setup_callbacks()
+        self._warm_caches()
+    
+    def _warm_caches(self, n_points=DEFAULT_N_POINTS, noise_level=DEFAULT_NOISE_LEVEL):
+        """
+        Pre-build figure templates and default-slider data for every type.
+        
+        Plotly figure validation is the slowest part of a first update, so
+        doing it here at startup keeps the first click on each data type
+        from stalling a fresh server process.
+        """
+        for data_type in DATA_TYPE_KEYS:
+            _figure_templates(data_type, self.colors['primary'], self.colors['secondary'])
+            generate_data(data_type, n_points, noise_level)
+            compute_statistics(data_type, n_points, noise_level)
+            compute_histogram(data_type, n_points, noise_level)
     
     def _setup_layout(self):
         """Create the dashboard layout with all components."""
         
+        # Render the default view straight into the layout so the page
+        # arrives complete, without an initial callback round-trip
+        initial_main, initial_hist = self._build_figures(
+            DEFAULT_DATA_TYPE, DEFAULT_N_POINTS, DEFAULT_NOISE_LEVEL
+        )
+        
         self.app.layout = html.Div([
             # ================================================================
             # HEADER SECTION
@@ -338,21 +827,8 @@ class FoundationDashboard:
                         html.Label("Select Data Type:", style=LABEL_STYLE),
                         dcc.Dropdown(
                             id='data-type',
-                            options=[
-                                {'label': f"{DATA_TYPE_INFO['sine']['icon']} Sine Wave", 
-                                 'value': 'sine'},
-                                {'label': f"{DATA_TYPE_INFO['exponential']['icon']} Exponential Decay", 
-                                 'value': 'exponential'},
-                                {'label': f"{DATA_TYPE_INFO['spectrum']['icon']} Astronomical Spectrum", 
-                                 'value': 'spectrum'},
-                                {'label': f"{DATA_TYPE_INFO['lightcurve']['icon']} Stellar Light Curve", 
-                                 'value': 'lightcurve'},
-                                {'label': f"{DATA_TYPE_INFO['transit']['icon']} Exoplanet Transit", 
-                                 'value': 'transit'},
-                                {'label': f"{DATA_TYPE_INFO['random']['icon']} Random Walk", 
-                                 'value': 'random'},
-                            ],
-                            value='sine',
+                            options=DATA_TYPE_OPTIONS,
+                            value=DEFAULT_DATA_TYPE,
                             style={
                                 'backgroundColor': '#FFFFFF',
                                 'color': '#000000',
@@ -362,82 +838,59 @@ class FoundationDashboard:
                         ),
                         html.P(
                             "Choose different astronomical data patterns to explore",
-                            style={
-                                'color': DASHBOARD_STYLES['text_muted'],
-                                'fontSize': '14px',
-                                'marginTop': '8px',
-                            }
+                            style=HELP_TEXT_STYLE
                         ),
-                    ], style={
-                        'width': '32%',
-                        'display': 'inline-block',
-                        'verticalAlign': 'top',
-                        'padding': '10px',
-                    }),
+                    ], style=CONTROL_COLUMN_STYLE),
                     
                     # Number of Points Slider
                     html.Div([
                         html.Label("Number of Points:", style=LABEL_STYLE),
                         dcc.Slider(
                             id='n-points',
-                            min=20,
-                            max=300,
+                            min=N_POINTS_RANGE[0],
+                            max=N_POINTS_RANGE[1],
                             step=10,
-                            value=100,
+                            value=DEFAULT_N_POINTS,
                             marks={
-                                20: {'label': '20', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
-                                100: {'label': '100', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
-                                200: {'label': '200', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
-                                300: {'label': '300', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
+                                20: {'label': '20', 'style': SLIDER_MARK_STYLE},
+                                100: {'label': '100', 'style': SLIDER_MARK_STYLE},
+                                200: {'label': '200', 'style': SLIDER_MARK_STYLE},
+                                300: {'label': '300', 'style': SLIDER_MARK_STYLE},
                             },
                             tooltip={'placement': 'bottom', 'always_visible': True},
+                            # Fire once per drag, not for every step passed
+                            updatemode='mouseup',
                         ),
                         html.P(
                             "More points = smoother curves, but slower updates",
-                            style={
-                                'color': DASHBOARD_STYLES['text_muted'],
-                                'fontSize': '14px',
-                                'marginTop': '8px',
-                            }
+                            style=HELP_TEXT_STYLE
                         ),
-                    ], style={
-                        'width': '32%',
-                        'display': 'inline-block',
-                        'verticalAlign': 'top',
-                        'padding': '10px',
-                    }),
+                    ], style=CONTROL_COLUMN_STYLE),
                     
                     # Noise Level Slider
                     html.Div([
                         html.Label("Noise Level:", style=LABEL_STYLE),
                         dcc.Slider(
                             id='noise-level',
-                            min=0,
-                            max=0.5,
+                            min=NOISE_RANGE[0],
+                            max=NOISE_RANGE[1],
                             step=0.05,
-                            value=0.1,
+                            value=DEFAULT_NOISE_LEVEL,
                             marks={
-                                0: {'label': '0', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
-                                0.1: {'label': '0.1', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
-                                0.25: {'label': '0.25', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
-                                0.5: {'label': '0.5', 'style': {'color': '#FFFFFF', 'fontSize': '14px'}},
+                                0: {'label': '0', 'style': SLIDER_MARK_STYLE},
+                                0.1: {'label': '0.1', 'style': SLIDER_MARK_STYLE},
+                                0.25: {'label': '0.25', 'style': SLIDER_MARK_STYLE},
+                                0.5: {'label': '0.5', 'style': SLIDER_MARK_STYLE},
                             },
                             tooltip={'placement': 'bottom', 'always_visible': True},
+                            # Fire once per drag, not for every step passed
+                            updatemode='mouseup',
                         ),
                         html.P(
                             "Simulates measurement uncertainty in real observations",
-                            style={
-                                'color': DASHBOARD_STYLES['text_muted'],
-                                'fontSize': '14px',
-                                'marginTop': '8px',
-                            }
+                            style=HELP_TEXT_STYLE
                         ),
-                    ], style={
-                        'width': '32%',
-                        'display': 'inline-block',
-                        'verticalAlign': 'top',
-                        'padding': '10px',
-                    }),
+                    ], style=CONTROL_COLUMN_STYLE),
                 ]),
             ], style=CARD_STYLE),
             
@@ -455,6 +908,7 @@ class FoundationDashboard:
                 ),
                 dcc.Graph(
                     id='main-plot',
+                    figure=initial_main,
                     style={'height': '500px'},
                     config={
                         'displayModeBar': True,
@@ -479,42 +933,29 @@ class FoundationDashboard:
                 html.Div([
                     html.H3(
                         "📈 Data Distribution",
-                        style={
-                            'color': DASHBOARD_STYLES['text'],
-                            'marginBottom': '15px',
-                            'fontSize': '20px',
-                        }
+                        style=CARD_TITLE_STYLE
                     ),
                     dcc.Graph(
                         id='histogram-plot',
+                        figure=initial_hist,
                         style={'height': '350px'},
                         config={'displayModeBar': False},
                     ),
-                ], style={
-                    **CARD_STYLE,
-                    'width': '48%',
-                    'display': 'inline-block',
-                    'verticalAlign': 'top',
-                }),
+                ], style=HALF_CARD_STYLE),
                 
                 # Statistics Display
                 html.Div([
                     html.H3(
                         "🔢 Statistics Summary",
-                        style={
-                            'color': DASHBOARD_STYLES['text'],
-                            'marginBottom': '15px',
-                            'fontSize': '20px',
-                        }
+                        style=CARD_TITLE_STYLE
                     ),
-                    html.Div(id='statistics-panel'),
-                ], style={
-                    **CARD_STYLE,
-                    'width': '48%',
-                    'display': 'inline-block',
-                    'verticalAlign': 'top',
-                    'marginLeft': '2%',
-                }),
+                    html.Div(
+                        self._build_stats_panel(
+                            DEFAULT_DATA_TYPE, DEFAULT_N_POINTS, DEFAULT_NOISE_LEVEL
+                        ),
+                        id='statistics-panel',
+                    ),
+                ], style=HALF_CARD_RIGHT_STYLE),
             ]),
             
             # ================================================================
@@ -529,7 +970,10 @@ class FoundationDashboard:
                         'fontSize': '22px',
                     }
                 ),
-                html.Div(id='education-panel'),
+                html.Div(
+                    self._build_education_panel(DEFAULT_DATA_TYPE),
+                    id='education-panel',
+                ),
             ], style=INFO_PANEL_STYLE),
             
             # ================================================================
@@ -570,10 +1014,7 @@ class FoundationDashboard:
                     'fontSize': '16px',
                     'lineHeight': '1.8',
                 }),
-            ], style={
-                **CARD_STYLE,
-                'marginTop': '20px',
-            }),
+            ], style=TIPS_CARD_STYLE),
             
             # ================================================================
             # FOOTER
@@ -605,69 +1046,6 @@ class FoundationDashboard:
             'fontFamily': 'system-ui, -apple-system, sans-serif',
         })
     
-    def _generate_data(self, data_type, n_points, noise_level):
-        """
-        Generate sample astronomical data based on user parameters.
-        
-        Parameters:
-        -----------
-        data_type : str
-            Type of data to generate
-        n_points : int
-            Number of data points
-        noise_level : float
-            Amount of random noise to add
-            
-        Returns:
-        --------
-        x, y : numpy arrays
-            The generated data
-        """
-        x = np.linspace(0, 10, n_points)
-        
-        if data_type == 'sine':
-            y = np.sin(x) + noise_level * np.random.random(n_points)
-            
-        elif data_type == 'exponential':
-            y = np.exp(-x / 3) + noise_level * 0.5 * np.random.random(n_points)
-            
-        elif data_type == 'spectrum':
-            # Continuum with noise
-            y = 1 + 0.1 * np.sin(5 * x) + noise_level * 0.5 * np.random.random(n_points)
-            # Add absorption features
-            absorption_centers = [2.5, 5.0, 7.5]
-            absorption_depths = [0.25, 0.15, 0.20]
-            for center, depth in zip(absorption_centers, absorption_depths):
-                y -= depth * np.exp(-(x - center)**2 / 0.15)
-                
-        elif data_type == 'lightcurve':
-            trend = -0.01 * x  # Slow dimming
-            periodic = 0.08 * np.sin(2 * np.pi * x / 2.5)  # Periodic variation
-            y = 1 + trend + periodic + noise_level * 0.2 * np.random.random(n_points)
-            
-        elif data_type == 'transit':
-            y = np.ones(n_points)
-            transit_center = 5.0
-            transit_duration = 1.5
-            transit_depth = 0.015
-            # Flat bottom transit
-            in_transit = np.abs(x - transit_center) < transit_duration / 2
-            y[in_transit] -= transit_depth
-            # Smooth ingress/egress
-            ingress = (x > transit_center - transit_duration/2 - 0.3) & \
-                      (x < transit_center - transit_duration/2 + 0.1)
-            egress = (x > transit_center + transit_duration/2 - 0.1) & \
-                     (x < transit_center + transit_duration/2 + 0.3)
-            y[ingress] -= transit_depth * 0.5
-            y[egress] -= transit_depth * 0.5
-            y += noise_level * 0.1 * np.random.random(n_points)
-            
-        else:  # random walk
-            y = np.cumsum(np.random.randn(n_points) * 0.3)
-            y += noise_level * np.random.random(n_points)
-        
-        return x, y
-    
     def _setup_callbacks(self):
         """Setup interactive callbacks for real-time updates."""
         
@@ -676,189 +1054,184 @@ class FoundationDashboard:
                 Output('main-plot', 'figure'),
                 Output('histogram-plot', 'figure'),
                 Output('statistics-panel', 'children'),
-                Output('education-panel', 'children'),
             ],
             [
                 Input('data-type', 'value'),
                 Input('n-points', 'value'),
                 Input('noise-level', 'value'),
-            ]
+            ],
+            prevent_initial_call=True,
         )
         def update_dashboard(data_type, n_points, noise_level):
-            """Update all dashboard components when parameters change."""
-            
-            # Generate data
-            x, y = self._generate_data(data_type, n_points, noise_level)
-            
-            # Get data type info
-            info = DATA_TYPE_INFO.get(data_type, DATA_TYPE_INFO['sine'])
-            
-            # ============================================================
-            # CREATE MAIN PLOT
-            # ============================================================
-            main_fig = go.Figure()
+            """Update plots and statistics when parameters change."""
             
-            main_fig.add_trace(go.Scatter(
-                x=x, y=y,
-                mode='lines+markers',
-                name='Data',
-                line=dict(color=self.colors['primary'], width=3),
-                marker=dict(
-                    size=7,
-                    color='white',
-                    line=dict(width=2, color=self.colors['primary'])
-                ),
-                hovertemplate=(
-                    f"<b>{info['xlabel']}:</b> %{{x:.4f}}<br>"
-                    f"<b>{info['ylabel']}:</b> %{{y:.4f}}<br>"
-                    "<extra></extra>"
-                ),
-            ))
+            # Keep the work bounded to what the sliders can produce
+            n_points = min(max(int(n_points), N_POINTS_RANGE[0]), N_POINTS_RANGE[1])
+            noise_level = min(max(noise_level, NOISE_RANGE[0]), NOISE_RANGE[1])
             
-            main_fig.update_layout(
-                title=dict(
-                    text=f"<b>{info['icon']} {info['title']}</b>",
-                    font=dict(size=24, color='white'),
-                    x=0.5,
-                ),
-                xaxis_title=dict(text=info['xlabel'], font=dict(size=18)),
-                yaxis_title=dict(text=info['ylabel'], font=dict(size=18)),
-                template='plotly_dark',
-                height=500,
-                font=dict(size=16, color='white'),
-                plot_bgcolor='rgba(22, 33, 62, 0.8)',
-                paper_bgcolor='rgba(0, 0, 0, 0)',
-                hovermode='closest',
-                margin=dict(l=60, r=40, t=60, b=50),
-            )
+            # Snap the noise level to the slider's 0.05 grid so float jitter
+            # such as 0.30000000000000004 still hits the caches
+            noise_level = round(noise_level, 2)
             
-            main_fig.update_xaxes(
-                gridcolor='rgba(255,255,255,0.1)',
-                tickfont=dict(size=14),
-            )
-            main_fig.update_yaxes(
-                gridcolor='rgba(255,255,255,0.1)',
-                tickfont=dict(size=14),
-            )
+            # The figures and the statistics are produced by this one
+            # callback from the same memoized arrays, so there is no need
+            # to round-trip them through a dcc.Store between callbacks.
             
             # ============================================================
-            # CREATE HISTOGRAM
+            # UPDATE FIGURES
             # ============================================================
-            hist_fig = go.Figure()
-            
-            hist_fig.add_trace(go.Histogram(
-                x=y,
-                nbinsx=25,
-                name='Distribution',
-                marker_color=self.colors['secondary'],
-                opacity=0.8,
-                hovertemplate=(
-                    "<b>Value:</b> %{x:.3f}<br>"
-                    "<b>Count:</b> %{y}<br>"
-                    "<extra></extra>"
-                ),
-            ))
-            
-            hist_fig.update_layout(
-                title=dict(
-                    text="<b>Y-Value Distribution</b>",
-                    font=dict(size=18, color='white'),
-                    x=0.5,
-                ),
-                xaxis_title=dict(text=info['ylabel'], font=dict(size=14)),
-                yaxis_title=dict(text="Frequency", font=dict(size=14)),
-                template='plotly_dark',
-                height=350,
-                font=dict(size=14, color='white'),
-                plot_bgcolor='rgba(22, 33, 62, 0.8)',
-                paper_bgcolor='rgba(0, 0, 0, 0)',
-                margin=dict(l=50, r=30, t=50, b=40),
-                bargap=0.1,
-            )
-            
-            hist_fig.update_xaxes(gridcolor='rgba(255,255,255,0.1)')
-            hist_fig.update_yaxes(gridcolor='rgba(255,255,255,0.1)')
+            if ctx.triggered_id in ('n-points', 'noise-level'):
+                # Sliders only change the data, so patch the trace arrays
+                # in place instead of resending the whole figure
+                x, y = generate_data(data_type, n_points, noise_level)
+                main_fig = Patch()
+                main_fig['data'][0]['x'] = _typed_array(x)
+                main_fig['data'][0]['y'] = _typed_array(y)
+                centers, counts = compute_histogram(data_type, n_points, noise_level)
+                hist_fig = Patch()
+                hist_fig['data'][0]['x'] = _typed_array(centers)
+                hist_fig['data'][0]['y'] = _typed_array(counts)
+            else:
+                # New data type: send the full figures
+                main_fig, hist_fig = self._build_figures(data_type, n_points, noise_level)
             
             # ============================================================
-            # CALCULATE STATISTICS
+            # STATISTICS PANEL (memoized per parameter set)
             # ============================================================
-            mean_val = np.mean(y)
-            std_val = np.std(y)
-            min_val = np.min(y)
-            max_val = np.max(y)
-            range_val = max_val - min_val
-            median_val = np.median(y)
+            stats_panel = self._build_stats_panel(data_type, n_points, noise_level)
             
-            # Create statistics panel with explanations
-            stats_panel = html.Div([
-                # Statistics values
-                html.Div([
-                    self._create_stat_row("Mean", mean_val, self.colors['primary']),
-                    self._create_stat_row("Std Dev", std_val, self.colors['warning']),
-                    self._create_stat_row("Median", median_val, self.colors['info']),
-                    self._create_stat_row("Min", min_val, self.colors['cyan']),
-                    self._create_stat_row("Max", max_val, self.colors['success']),
-                    self._create_stat_row("Range", range_val, self.colors['secondary']),
-                ], style={'marginBottom': '15px'}),
-                
-                # Data info
-                html.Hr(style={'borderColor': 'rgba(255,255,255,0.2)'}),
-                html.Div([
-                    html.P([
-                        html.Strong("Points: ", style={'color': self.colors['light']}),
-                        f"{n_points}",
-                    ], style={'marginBottom': '5px'}),
-                    html.P([
-                        html.Strong("Noise Level: ", style={'color': self.colors['light']}),
-                        f"{noise_level:.2f}",
-                    ], style={'marginBottom': '5px'}),
-                ], style={'fontSize': '15px', 'color': DASHBOARD_STYLES['text_muted']}),
-            ])
-            
-            # ============================================================
-            # CREATE EDUCATION PANEL
-            # ============================================================
-            education_panel = html.Div([
-                html.H4(
-                    f"{info['icon']} {info['title']}",
+            return main_fig, hist_fig, stats_panel
+        
+        @self.app.callback(
+            Output('education-panel', 'children'),
+            Input('data-type', 'value'),
+            prevent_initial_call=True,
+        )
+        def update_education_panel(data_type):
+            """Update the educational panel when the data type changes."""
+            # Separate from update_dashboard: the panel only depends on the
+            # data type, so slider drags no longer rebuild it.
+            return self._build_education_panel(data_type)
+    
+    def _build_figures(self, data_type, n_points, noise_level):
+        """
+        Build the full main plot and histogram figure dicts.
+        
+        The cached templates supply the traces' styling and layout; only
+        the data arrays are filled in here.
+        
+        Returns:
+        --------
+        main_fig, hist_fig : dict
+            Figure dicts ready to hand to dcc.Graph
+        """
+        x, y = generate_data(data_type, n_points, noise_level)
+        centers, counts = compute_histogram(data_type, n_points, noise_level)
+        
+        main_template, hist_template = _figure_templates(
+            data_type if data_type in DATA_TYPE_INFO else 'sine',
+            self.colors['primary'],
+            self.colors['secondary'],
+        )
+        main_fig = {
+            'data': [{
+                **main_template['data'][0],
+                'x': _typed_array(x),
+                'y': _typed_array(y),
+            }],
+            'layout': main_template['layout'],
+        }
+        hist_fig = {
+            'data': [{
+                **hist_template['data'][0],
+                'x': _typed_array(centers),
+                'y': _typed_array(counts),
+            }],
+            'layout': hist_template['layout'],
+        }
+        return main_fig, hist_fig
+    
+    def _build_education_panel(self, data_type):
+        """
+        Build the educational description panel for a data type.
+        
+        Wrapped in an LRU cache in __init__, one entry per data type.
+        """
+        info = DATA_TYPE_INFO.get(data_type, DATA_TYPE_INFO['sine'])
+        
+        return html.Div([
+            html.H4(
+                f"{info['icon']} {info['title']}",
+                style={
+                    'color': self.colors['primary'],
+                    'marginBottom': '15px',
+                    'fontSize': '20px',
+                }
+            ),
+            html.P(
+                info['description'],
+                style={
+                    'fontSize': '16px',
+                    'lineHeight': '1.7',
+                    'marginBottom': '15px',
+                    'color': DASHBOARD_STYLES['text'],
+                }
+            ),
+            html.Div([
+                html.H5(
+                    "🔭 Astronomy Context:",
                     style={
-                        'color': self.colors['primary'],
-                        'marginBottom': '15px',
-                        'fontSize': '20px',
+                        'color': self.colors['success'],
+                        'marginBottom': '10px',
+                        'fontSize': '17px',
                     }
                 ),
                 html.P(
-                    info['description'],
+                    info['astronomy_context'],
                     style={
-                        'fontSize': '16px',
+                        'fontSize': '15px',
                         'lineHeight': '1.7',
-                        'marginBottom': '15px',
-                        'color': DASHBOARD_STYLES['text'],
+                        'color': DASHBOARD_STYLES['text_muted'],
+                        'paddingLeft': '15px',
+                        'borderLeft': _border(3, self.colors['success']),
                     }
                 ),
-                html.Div([
-                    html.H5(
-                        "🔭 Astronomy Context:",
-                        style={
-                            'color': self.colors['success'],
-                            'marginBottom': '10px',
-                            'fontSize': '17px',
-                        }
-                    ),
-                    html.P(
-                        info['astronomy_context'],
-                        style={
-                            'fontSize': '15px',
-                            'lineHeight': '1.7',
-                            'color': DASHBOARD_STYLES['text_muted'],
-                            'paddingLeft': '15px',
-                            'borderLeft': f"3px solid {self.colors['success']}",
-                        }
-                    ),
-                ]),
-            ])
+            ]),
+        ])
+    
+    def _build_stats_panel(self, data_type, n_points, noise_level):
+        """
+        Build the statistics panel for one parameter set.
+        
+        Wrapped in an LRU cache in __init__, so revisiting a slider
+        position reuses the already-built component tree.
+        """
+        stats = compute_statistics(data_type, n_points, noise_level)
+        
+        return html.Div([
+            # Statistics values
+            html.Div([
+                self._create_stat_row("Mean", stats['mean'], self.colors['primary']),
+                self._create_stat_row("Std Dev", stats['std'], self.colors['warning']),
+                self._create_stat_row("Median", stats['median'], self.colors['info']),
+                self._create_stat_row("Min", stats['min'], self.colors['cyan']),
+                self._create_stat_row("Max", stats['max'], self.colors['success']),
+                self._create_stat_row("Range", stats['range'], self.colors['secondary']),
+            ], style={'marginBottom': '15px'}),
             
-            return main_fig, hist_fig, stats_panel, education_panel
+            # Data info
+            html.Hr(style={'borderColor': 'rgba(255,255,255,0.2)'}),
+            html.Div([
+                html.P([
+                    html.Strong("Points: ", style={'color': self.colors['light']}),
+                    f"{n_points}",
+                ], style={'marginBottom': '5px'}),
+                html.P([
+                    html.Strong("Noise Level: ", style={'color': self.colors['light']}),
+                    f"{noise_level:.2f}",
+                ], style={'marginBottom': '5px'}),
+            ], style={'fontSize': '15px', 'color': DASHBOARD_STYLES['text_muted']}),
+        ])
     
     def _create_stat_row(self, label, value, color):
         """Create a formatted statistics row."""
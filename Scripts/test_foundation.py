@@ -29,10 +29,18 @@ Exit Codes:
 
 import sys
 import os
+import functools
 import importlib
+import time
 import traceback
 from datetime import datetime
 
+# Use the non-interactive Agg backend unless the user picked one, so no
+# import of matplotlib in this process probes for GUI toolkits.
+# run_visual_test switches to an interactive backend only when it actually
+# shows a window.
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 # =============================================================================
 # TERMINAL COLOR SUPPORT
 # =============================================================================
@@ -40,8 +48,13 @@ from datetime import datetime
 class Colors:
     """ANSI color codes for terminal output."""
     
-    # Check if terminal supports colors
-    ENABLED = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+    # Check if terminal supports colors. Asking the OS about the stdout
+    # descriptor also copes with stdout being None or a capture object
+    # without a real file descriptor.
+    try:
+        ENABLED = os.isatty(sys.stdout.fileno())
+    except (AttributeError, OSError, ValueError):
+        ENABLED = False
     
     # Color codes
     RESET = '\033[0m' if ENABLED else ''
@@ -57,25 +70,40 @@ class Colors:
     CYAN = '\033[96m' if ENABLED else ''
     WHITE = '\033[97m' if ENABLED else ''
     
+    # Combined prefix for section headers
+    HEADER_PREFIX = BOLD + BLUE
+    
+    # Helpers take str and wrap it by concatenation (no format step)
+    
     @classmethod
     def success(cls, text):
-        return f"{cls.GREEN}{text}{cls.RESET}"
+        return cls.GREEN + text + cls.RESET
     
     @classmethod
     def error(cls, text):
-        return f"{cls.RED}{text}{cls.RESET}"
+        return cls.RED + text + cls.RESET
     
     @classmethod
     def warning(cls, text):
-        return f"{cls.YELLOW}{text}{cls.RESET}"
+        return cls.YELLOW + text + cls.RESET
     
     @classmethod
     def info(cls, text):
-        return f"{cls.CYAN}{text}{cls.RESET}"
+        return cls.CYAN + text + cls.RESET
     
     @classmethod
     def header(cls, text):
-        return f"{cls.BOLD}{cls.BLUE}{text}{cls.RESET}"
+        return cls.HEADER_PREFIX + text + cls.RESET
+
+
+# Without color support every code above is '', so the helpers can simply
+# hand their text back instead of concatenating empty strings around it
+if not Colors.ENABLED:
+    def _plain(text):
+        return text
+    
+    Colors.success = Colors.error = Colors.warning = staticmethod(_plain)
+    Colors.info = Colors.header = staticmethod(_plain)
 
 
 # =============================================================================
@@ -85,11 +113,22 @@ class Colors:
 class TestResult:
     """Track individual test results."""
     
+    # Results are plain records; slots keep each instance small
+    __slots__ = ('name', 'status', 'message', 'details', 'fix_hint')
+    
     PASS = 'pass'
     FAIL = 'fail'
     WARN = 'warn'
     SKIP = 'skip'
     
+    # Colored status icons, built once; unknown statuses render as SKIP
+    _ICONS = {
+        PASS: Colors.success("✓"),
+        FAIL: Colors.error("✗"),
+        WARN: Colors.warning("?"),
+        SKIP: Colors.info("○"),
+    }
+    
     def __init__(self, name, status, message, details=None, fix_hint=None):
         self.name = name
         self.status = status
@@ -98,15 +137,7 @@ class TestResult:
         self.fix_hint = fix_hint
     
     def __str__(self):
-        if self.status == self.PASS:
-            icon = Colors.success("✓")
-        elif self.status == self.FAIL:
-            icon = Colors.error("✗")
-        elif self.status == self.WARN:
-            icon = Colors.warning("?")
-        else:
-            icon = Colors.info("○")
-        
+        icon = self._ICONS.get(self.status, self._ICONS[self.SKIP])
         return f"{icon} {self.message}"
 
 
@@ -116,21 +147,37 @@ class TestResults:
     def __init__(self):
         self.results = []
         self.start_time = datetime.now()
+        self._t0 = time.perf_counter()  # monotonic clock for the duration
+        # Running tally per status, kept up to date by add()
+        self._counts = {
+            TestResult.PASS: 0,
+            TestResult.FAIL: 0,
+            TestResult.WARN: 0,
+            TestResult.SKIP: 0,
+        }
     
     def add(self, result):
         self.results.append(result)
+        self._counts[result.status] = self._counts.get(result.status, 0) + 1
+    
+    def extend(self, results):
+        """Add a batch of results, e.g. everything one test function returned."""
+        self.results.extend(results)
+        counts = self._counts
+        for result in results:
+            counts[result.status] = counts.get(result.status, 0) + 1
     
     @property
     def passed(self):
-        return sum(1 for r in self.results if r.status == TestResult.PASS)
+        return self._counts[TestResult.PASS]
     
     @property
     def failed(self):
-        return sum(1 for r in self.results if r.status == TestResult.FAIL)
+        return self._counts[TestResult.FAIL]
     
     @property
     def warnings(self):
-        return sum(1 for r in self.results if r.status == TestResult.WARN)
+        return self._counts[TestResult.WARN]
     
     @property
     def total(self):
@@ -144,13 +191,56 @@ class TestResults:
     
     @property
     def duration(self):
-        return (datetime.now() - self.start_time).total_seconds()
+        return time.perf_counter() - self._t0
 
 
 # =============================================================================
 # PACKAGE TESTING FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _probe(import_name):
+    """
+    Import a module once and remember the outcome.
+    
+    Returns:
+    --------
+    (module, version, error) : module and its __version__ (or 'unknown')
+        on success, otherwise (None, None, ImportError)
+    """
+    try:
+        # Modules already loaded elsewhere skip the import system
+        module = sys.modules.get(import_name) or importlib.import_module(import_name)
+    except ImportError as e:
+        return None, None, e
+    return module, getattr(module, '__version__', 'unknown'), None
+
+
+_pkg_version = None
+
+
+def _get_pkg_version():
+    """
+    Return packaging.version, importing it on first use only.
+    
+    Returns None when packaging is not installed, in which case version
+    checks are skipped rather than reported as a missing package.
+    """
+    global _pkg_version
+    if _pkg_version is None:
+        try:
+            from packaging import version as _pkg_version
+        except ImportError:
+            _pkg_version = False  # remember the miss too
+    return _pkg_version or None
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_version(version_string):
+    """Parse a version string once; the minimum versions are literals."""
+    return _get_pkg_version().parse(version_string)
+
+
 def test_import(package_name, import_name=None, min_version=None):
     """
     Test if a package can be imported.
@@ -171,34 +261,32 @@ def test_import(package_name, import_name=None, min_version=None):
     if import_name is None:
         import_name = package_name.lower()
     
-    try:
-        module = importlib.import_module(import_name)
-        version = getattr(module, '__version__', 'unknown')
-        
-        # Check version if specified
-        if min_version and version != 'unknown':
-            from packaging import version as pkg_version
-            if pkg_version.parse(version) < pkg_version.parse(min_version):
-                return TestResult(
-                    package_name,
-                    TestResult.WARN,
-                    f"{package_name} v{version} (recommend >= {min_version})",
-                    fix_hint=f"pip install --upgrade {import_name}"
-                )
-        
-        return TestResult(
-            package_name,
-            TestResult.PASS,
-            f"{package_name} v{version}"
-        )
-    except ImportError as e:
+    module, version, error = _probe(import_name)
+    
+    if module is None:
         return TestResult(
             package_name,
             TestResult.FAIL,
             f"{package_name} not found",
-            details=str(e),
+            details=str(error),
             fix_hint=f"pip install {import_name}"
         )
+    
+    # Check version if specified
+    if min_version and version != 'unknown' and _get_pkg_version() is not None:
+        if _parse_version(version) < _parse_version(min_version):
+            return TestResult(
+                package_name,
+                TestResult.WARN,
+                f"{package_name} v{version} (recommend >= {min_version})",
+                fix_hint=f"pip install --upgrade {import_name}"
+            )
+    
+    return TestResult(
+        package_name,
+        TestResult.PASS,
+        f"{package_name} v{version}"
+    )
 
 
 def test_package_group(group_name, packages):
@@ -209,63 +297,66 @@ def test_package_group(group_name, packages):
     -----------
     group_name : str
         Name of the package group
-    packages : list of tuples
-        Each tuple: (display_name, import_name, min_version)
+    packages : sequence of tuples
+        Each tuple: (display_name, import_name, min_version), where
+        min_version may be None
         
     Returns:
     --------
     list of TestResult
     """
-    results = []
-    for pkg_info in packages:
-        if isinstance(pkg_info, str):
-            results.append(test_import(pkg_info))
-        elif len(pkg_info) == 1:
-            results.append(test_import(pkg_info[0]))
-        elif len(pkg_info) == 2:
-            results.append(test_import(pkg_info[0], pkg_info[1]))
-        else:
-            results.append(test_import(pkg_info[0], pkg_info[1], pkg_info[2]))
-    return results
+    return [test_import(*spec) for spec in packages]
 
 
 # =============================================================================
 # MAIN TEST CATEGORIES
 # =============================================================================
 
+# Package specs as (display_name, import_name, min_version)
+_CORE_PACKAGES = (
+    ('NumPy', 'numpy', '1.20.0'),
+    ('SciPy', 'scipy', '1.7.0'),
+    ('Matplotlib', 'matplotlib', '3.4.0'),
+    ('Pandas', 'pandas', '1.3.0'),
+)
+
+_ASTRONOMY_PACKAGES = (
+    ('Astropy', 'astropy', '5.0'),
+)
+
+_VISUALIZATION_PACKAGES = (
+    ('Plotly', 'plotly', '5.0.0'),
+    ('Seaborn', 'seaborn', '0.11.0'),
+)
+
+
 def test_core_scientific_stack():
     """Test core scientific computing packages."""
-    packages = [
-        ('NumPy', 'numpy', '1.20.0'),
-        ('SciPy', 'scipy', '1.7.0'),
-        ('Matplotlib', 'matplotlib', '3.4.0'),
-        ('Pandas', 'pandas', '1.3.0'),
-    ]
-    return test_package_group("Core Scientific Stack", packages)
+    return test_package_group("Core Scientific Stack", _CORE_PACKAGES)
 
 
 def test_astronomy_libraries():
     """Test astronomy-specific packages."""
-    packages = [
-        ('Astropy', 'astropy', '5.0'),
-    ]
-    results = test_package_group("Astronomy Libraries", packages)
+    results = test_package_group("Astronomy Libraries", _ASTRONOMY_PACKAGES)
     
-    # Additional astropy submodule tests
-    try:
-        import astropy.units as u
-        import astropy.coordinates as coord
+    # Additional astropy submodule tests. _probe checks sys.modules first,
+    # and astropy usually has these loaded already.
+    _, _, error = _probe('astropy.units')
+    if error is None:
+        _, _, error = _probe('astropy.coordinates')
+    
+    if error is None:
         results.append(TestResult(
             'Astropy Units',
             TestResult.PASS,
             "Astropy units & coordinates modules working"
         ))
-    except ImportError as e:
+    else:
         results.append(TestResult(
             'Astropy Units',
             TestResult.FAIL,
             "Astropy submodules failed",
-            details=str(e)
+            details=str(error)
         ))
     
     return results
@@ -273,11 +364,7 @@ def test_astronomy_libraries():
 
 def test_visualization_tools():
     """Test visualization packages."""
-    packages = [
-        ('Plotly', 'plotly', '5.0.0'),
-        ('Seaborn', 'seaborn', '0.11.0'),
-    ]
-    results = test_package_group("Visualization Tools", packages)
+    results = test_package_group("Visualization Tools", _VISUALIZATION_PACKAGES)
     
     # Bokeh is optional
     try:
@@ -392,55 +479,53 @@ def test_development_tools():
     return results
 
 
+# Accepted names for the kit's home directory, in order of preference
+_ASTRO_HOME_VARS = ('ASTRO_HOME', 'ASTRO_DEV_HOME', 'ASTRONOMY_HOME')
+
+# Interpreter isolation never changes after startup, so decide it once
+_VENV_INDICATORS = ('astro', 'env', 'venv', '.astro')
+_IN_VENV = (
+    any(ind in sys.executable.lower() for ind in _VENV_INDICATORS)
+    or hasattr(sys, 'real_prefix')
+    or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+)
+
+
 def test_environment_config():
     """Test environment configuration."""
     results = []
     
-    # Check ASTRO_HOME environment variable
-    astro_home = os.environ.get('ASTRO_HOME')
-    if astro_home:
-        if os.path.isdir(astro_home):
-            results.append(TestResult(
-                'ASTRO_HOME',
-                TestResult.PASS,
-                f"ASTRO_HOME set: {astro_home}"
-            ))
-        else:
-            results.append(TestResult(
-                'ASTRO_HOME',
-                TestResult.WARN,
-                f"ASTRO_HOME directory not found: {astro_home}",
-                fix_hint="mkdir -p $ASTRO_HOME"
-            ))
+    # Check ASTRO_HOME environment variable (or one of its alternative names)
+    found = next(
+        ((name, os.environ[name]) for name in _ASTRO_HOME_VARS if os.environ.get(name)),
+        None
+    )
+    if found is None:
+        results.append(TestResult(
+            'ASTRO_HOME',
+            TestResult.WARN,
+            "ASTRO_HOME not set (optional)",
+            fix_hint="export ASTRO_HOME=~/.astro"
+        ))
+    elif found[0] == 'ASTRO_HOME' and not os.path.isdir(found[1]):
+        results.append(TestResult(
+            'ASTRO_HOME',
+            TestResult.WARN,
+            f"ASTRO_HOME directory not found: {found[1]}",
+            fix_hint="mkdir -p $ASTRO_HOME"
+        ))
     else:
-        # Check alternative names
-        alt_names = ['ASTRO_DEV_HOME', 'ASTRONOMY_HOME']
-        found = False
-        for alt in alt_names:
-            val = os.environ.get(alt)
-            if val:
-                results.append(TestResult(
-                    'ASTRO_HOME',
-                    TestResult.PASS,
-                    f"{alt} set: {val}"
-                ))
-                found = True
-                break
-        
-        if not found:
-            results.append(TestResult(
-                'ASTRO_HOME',
-                TestResult.WARN,
-                "ASTRO_HOME not set (optional)",
-                fix_hint="export ASTRO_HOME=~/.astro"
-            ))
+        name, value = found
+        results.append(TestResult(
+            'ASTRO_HOME',
+            TestResult.PASS,
+            f"{name} set: {value}"
+        ))
     
     # Check Python environment isolation
     executable = sys.executable
-    venv_indicators = ['astro', 'env', 'venv', '.astro']
-    in_venv = any(ind in executable.lower() for ind in venv_indicators)
     
-    if in_venv or hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
+    if _IN_VENV:
         env_name = os.path.basename(os.path.dirname(executable))
         results.append(TestResult(
             'Virtual Environment',
@@ -606,17 +691,14 @@ def test_matplotlib_plotting():
         ax.set_xlabel('X')
         ax.set_ylabel('Y')
         
-        # Save to temp file to verify it works
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            temp_path = f.name
-        
-        fig.savefig(temp_path, dpi=72)
+        # Render to an in-memory PNG to verify saving works
+        import io
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=72)
         plt.close(fig)
         
-        # Verify file was created
-        if os.path.exists(temp_path) and os.path.getsize(temp_path) > 0:
-            os.unlink(temp_path)  # Clean up
+        # Verify image data was written
+        if buffer.tell() > 0:
             results.append(TestResult(
                 'Matplotlib Plotting',
                 TestResult.PASS,
@@ -626,7 +708,7 @@ def test_matplotlib_plotting():
             results.append(TestResult(
                 'Matplotlib Plotting',
                 TestResult.FAIL,
-                "Plot file not created properly"
+                "Plot image not created properly"
             ))
             
     except Exception as e:
@@ -696,7 +778,7 @@ def run_visual_test(show_plot=True):
         import matplotlib.pyplot as plt
         import numpy as np
         
-        # Don't use Agg backend for visual test
+        # Switch away from the default Agg backend only when a window is wanted
         if show_plot:
             import matplotlib
             # Try to use an interactive backend
@@ -773,6 +855,31 @@ def run_visual_test(show_plot=True):
 # MAIN TEST RUNNER
 # =============================================================================
 
+# Test categories in run order: key -> (section title, icon, test functions).
+# Nothing is imported until a category's functions are actually called, so
+# running a subset only loads the packages that subset checks.
+TEST_CATEGORIES = {
+    'core': ("Core Scientific Stack", "📦", (test_core_scientific_stack,)),
+    'astronomy': ("Astronomy Libraries", "🌟", (test_astronomy_libraries,)),
+    'visualization': ("Visualization Tools", "📊", (test_visualization_tools,)),
+    'jupyter': ("Jupyter Components", "📓", (test_jupyter_components,)),
+    'dev': ("Development Tools", "🔧", (test_development_tools,)),
+    'env': ("Environment Configuration", "⚙️", (test_environment_config,)),
+    'foundations': ("Visual Foundations Library", "🎨", (test_visual_foundations,)),
+    'functional': ("Functional Tests", "🧪", (
+        test_numpy_operations,
+        test_matplotlib_plotting,
+        test_astropy_units,
+    )),
+}
+
+
+# Success-rate bar pieces; the summary slices these instead of repeating
+_BAR_LENGTH = 30
+_BAR_FULL = "█" * _BAR_LENGTH
+_BAR_EMPTY = "░" * _BAR_LENGTH
+
+
 def print_section(title, icon=""):
     """Print a formatted section header."""
     full_title = f"{icon} {title}" if icon else title
@@ -782,13 +889,17 @@ def print_section(title, icon=""):
 
 def print_results(results, show_hints=True):
     """Print test results with optional fix hints."""
+    # Build the section, then write it in one call rather than one per line
+    fix_label = Colors.info('→ Fix:')
+    lines = []
     for result in results:
-        print(f"  {result}")
-        if show_hints and result.fix_hint and result.status in [TestResult.FAIL, TestResult.WARN]:
-            print(f"    {Colors.info('→ Fix:')} {result.fix_hint}")
+        lines.append(f"  {result}\n")
+        if show_hints and result.fix_hint and result.status in (TestResult.FAIL, TestResult.WARN):
+            lines.append(f"    {fix_label} {result.fix_hint}\n")
+    sys.stdout.write(''.join(lines))
 
 
-def run_all_tests(visual=True, verbose=True):
+def run_all_tests(visual=True, verbose=True, categories=None):
     """
     Run all environment tests.
     
@@ -798,6 +909,8 @@ def run_all_tests(visual=True, verbose=True):
         If True, show a visual test plot at the end
     verbose : bool
         If True, show detailed output
+    categories : list of str, optional
+        Keys of TEST_CATEGORIES to run (default: all, in order)
         
     Returns:
     --------
@@ -816,87 +929,18 @@ def run_all_tests(visual=True, verbose=True):
     print("=" * 60)
     
     # =========================================================================
-    # TEST 1: Core Scientific Stack
-    # =========================================================================
-    print_section("Core Scientific Stack", "📦")
-    results = test_core_scientific_stack()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    # =========================================================================
-    # TEST 2: Astronomy Libraries
+    # TEST CATEGORIES
     # =========================================================================
-    print_section("Astronomy Libraries", "🌟")
-    results = test_astronomy_libraries()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
+    if categories is None:
+        categories = list(TEST_CATEGORIES)
     
-    # =========================================================================
-    # TEST 3: Visualization Tools
-    # =========================================================================
-    print_section("Visualization Tools", "📊")
-    results = test_visualization_tools()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    # =========================================================================
-    # TEST 4: Jupyter Components
-    # =========================================================================
-    print_section("Jupyter Components", "📓")
-    results = test_jupyter_components()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    # =========================================================================
-    # TEST 5: Development Tools
-    # =========================================================================
-    print_section("Development Tools", "🔧")
-    results = test_development_tools()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    # =========================================================================
-    # TEST 6: Environment Configuration
-    # =========================================================================
-    print_section("Environment Configuration", "⚙️")
-    results = test_environment_config()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    # =========================================================================
-    # TEST 7: Visual Foundations Library
-    # =========================================================================
-    print_section("Visual Foundations Library", "🎨")
-    results = test_visual_foundations()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    # =========================================================================
-    # TEST 8: Functional Tests
-    # =========================================================================
-    print_section("Functional Tests", "🧪")
-    
-    results = test_numpy_operations()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    results = test_matplotlib_plotting()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
-    
-    results = test_astropy_units()
-    for r in results:
-        all_results.add(r)
-    print_results(results)
+    for key in categories:
+        title, icon, test_functions = TEST_CATEGORIES[key]
+        print_section(title, icon)
+        for test_function in test_functions:
+            results = test_function()
+            all_results.extend(results)
+            print_results(results)
     
     # =========================================================================
     # SUMMARY
@@ -928,9 +972,8 @@ def run_all_tests(visual=True, verbose=True):
     
     # Success rate bar
     rate = all_results.success_rate
-    bar_length = 30
-    filled = int(bar_length * rate / 100)
-    bar = "█" * filled + "░" * (bar_length - filled)
+    filled = int(_BAR_LENGTH * rate / 100)
+    bar = _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
     
     if rate >= 80:
         bar_color = Colors.GREEN
@@ -988,8 +1031,9 @@ def run_all_tests(visual=True, verbose=True):
 # COMMAND LINE INTERFACE
 # =============================================================================
 
-def main():
-    """Main entry point with argument parsing."""
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command-line parser (once; later calls reuse it)."""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -1000,6 +1044,7 @@ Examples:
   python test_foundation.py              # Run all tests with visual
   python test_foundation.py --no-visual  # Skip visual test
   python test_foundation.py --quiet      # Minimal output
+  python test_foundation.py --only core env  # Run selected categories
         """
     )
     
@@ -1015,18 +1060,32 @@ Examples:
         help='Minimal output (only show summary)'
     )
     
+    parser.add_argument(
+        '--only',
+        nargs='+',
+        choices=list(TEST_CATEGORIES),
+        metavar='CATEGORY',
+        help=f"Run only these categories ({', '.join(TEST_CATEGORIES)})"
+    )
+    
     parser.add_argument(
         '--version', '-v',
         action='version',
         version='Astronomy Foundation Test v1.0.0'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point with argument parsing."""
+    args = _build_parser().parse_args()
     
     # Run tests
     exit_code = run_all_tests(
         visual=not args.no_visual,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        categories=args.only,
     )
     
     sys.exit(exit_code)